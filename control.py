@@ -5,15 +5,44 @@ Network-based interactive control for FCU core with enhanced UI
 """
 
 import socket
+import selectors
 import threading
-import time
 import sys
 import signal
 import json
-import readline
+import functools
+import atexit
 import os
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(message: bytes):
+    """Parse a UTF-8 JSON message, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(message)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers beyond 64 bits,
+            # which the stdlib parser accepts
+            pass
+    return json.loads(message)
+
+
+def json_dumps_pretty(data) -> str:
+    """Pretty-print JSON data, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits from the stdlib fallback parser
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -34,40 +63,121 @@ class Colors:
         return f"{color}{text}{Colors.END}"
 
 
+def _fmt_num(value, spec: str = '.3f') -> str:
+    """Format a numeric field, passing placeholders like 'N/A' through"""
+    if isinstance(value, (int, float)):
+        return format(value, spec)
+    return str(value)
+
+
+def _xyz_format(title: str, unit: str = "") -> str:
+    """Build a format template for a titled X/Y/Z block"""
+    return "".join(
+        [f"  {Colors.BOLD}{title}:{Colors.END}\n"] +
+        [f"    {axis}: {Colors.CYAN}{{}}{Colors.END}{unit}\n" for axis in "XYZ"])
+
+
+# Debug output templates, with the ANSI escapes baked in at import time
+_POS_FMT = _xyz_format("World Position")
+_LIN_VEL_FMT = _xyz_format("Linear Velocity", " m/s")
+_ACC_FMT = _xyz_format("IMU Acceleration", " m/s²")
+_ORIENT_FMT = (
+    f"  {Colors.BOLD}Orientation:{Colors.END}\n"
+    f"    Roll:  {Colors.CYAN}{{}}{Colors.END} rad\n"
+    f"    Pitch: {Colors.CYAN}{{}}{Colors.END} rad\n"
+    f"    Yaw:   {Colors.CYAN}{{}}{Colors.END} rad\n")
+_GNSS_FMT = (
+    f"  {Colors.BOLD}GNSS:{Colors.END}\n"
+    f"    Latitude:  {Colors.CYAN}{{}}{Colors.END}\n"
+    f"    Longitude: {Colors.CYAN}{{}}{Colors.END}\n"
+    f"    Altitude:  {Colors.CYAN}{{}}{Colors.END} m\n")
+_TOPICS_HEADER_FMT = f"  {Colors.BOLD}ROS Topics ({{}} total):{Colors.END}\n"
+_TOPIC_FMT = f"    {Colors.CYAN}{{!s:<30}}{Colors.END} {Colors.WHITE}{{}}{Colors.END}\n"
+
+
+RECV_BUFFER_SIZE = 65536
+
+
 class DroneController:
-    def __init__(self, host='localhost', port=8888):
+    def __init__(self, host='localhost', port=8888, verbose=False):
         self.host = host
         self.port = port
+        self.verbose = verbose
         self.socket = None
+        self._sel = selectors.DefaultSelector()
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buf)
         self.connected = False
         self.running = True
 
-        # Command mapping with descriptions
+        # Command mapping to (name, description)
         self.commands = {
-            'a': {'name': 'Unlock', 'description': 'Unlock the drone'},
-            'd': {'name': 'Lock', 'description': 'Lock the drone'},
-            't': {'name': 'Takeoff', 'description': 'Take off the drone'},
-            'l': {'name': 'Land', 'description': 'Land the drone'},
-            'r': {'name': 'Run', 'description': 'Start mission'},
-            's': {'name': 'Stop', 'description': 'Stop mission'},
-            '1': {'name': 'Position 1', 'description': 'Go to position 1'},
-            '2': {'name': 'Position 2', 'description': 'Go to position 2'},
-            '3': {'name': 'Position 3', 'description': 'Go to position 3'},
-            '4': {'name': 'Position 4', 'description': 'Go to position 4'},
-            'p': {'name': 'Position Info', 'description': 'Get current position and orientation'},
-            'i': {'name': 'Topic Info', 'description': 'List all ROS topics'},
-            'h': {'name': 'Help', 'description': 'Show this help'},
-            'q': {'name': 'Quit', 'description': 'Exit the program'}
+            'a': ('Unlock', 'Unlock the drone'),
+            'd': ('Lock', 'Lock the drone'),
+            't': ('Takeoff', 'Take off the drone'),
+            'l': ('Land', 'Land the drone'),
+            'r': ('Run', 'Start mission'),
+            's': ('Stop', 'Stop mission'),
+            '1': ('Position 1', 'Go to position 1'),
+            '2': ('Position 2', 'Go to position 2'),
+            '3': ('Position 3', 'Go to position 3'),
+            '4': ('Position 4', 'Go to position 4'),
+            'p': ('Position Info', 'Get current position and orientation'),
+            'i': ('Topic Info', 'List all ROS topics'),
+            'h': ('Help', 'Show this help'),
+            'q': ('Quit', 'Exit the program')
         }
 
-        # Setup readline for autocomplete
-        self.setup_readline()
+        # Group commands by category for the help screen, as
+        # (command, name, description) entries
+        self._flight = self._command_group('adtl')
+        self._mission = self._command_group('rs1234')
+        self._info = self._command_group('pi')
+        self._system = self._command_group('hq')
+
+        # The command table is fixed, so render help output only once
+        self._help_text = self._render_help()
+        self._format_commands = functools.lru_cache(maxsize=4)(
+            self._render_commands)
+
+        # Printers for each server message type
+        self._printers = {
+            'welcome': self._print_welcome,
+            'command': self._print_command,
+            'status': self._print_status,
+            'debug': self._print_debug,
+            'help': self._print_help,
+            'error': self._print_error,
+            'goodbye': self._print_goodbye,
+        }
+
+        # Built-in (client-side) commands handled by interactive mode
+        self._dispatch = {
+            'q': self._quit,
+            'quit': self._quit,
+            'exit': self._quit,
+            'h': self.show_help,
+            'help': self.show_help,
+            'clear': self._clear,
+            'ls': self.show_help,
+            'commands': self.show_help,
+        }
+
+        # Setup readline for autocomplete (not needed for piped input)
+        if sys.stdin.isatty():
+            self.setup_readline()
 
         # Setup signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
 
+    def _command_group(self, cmds: str) -> Tuple[Tuple[str, str, str], ...]:
+        """Collect (command, name, description) entries for a help group"""
+        return tuple((c, *self.commands[c]) for c in cmds if c in self.commands)
+
     def setup_readline(self):
         """Setup readline for autocomplete and history"""
+        import readline
+
         # Set up tab completion
         readline.set_completer(self.completer)
         readline.parse_and_bind("tab: complete")
@@ -81,7 +191,6 @@ class DroneController:
             pass
 
         # Save history on exit
-        import atexit
         atexit.register(lambda: readline.write_history_file(histfile))
 
         # Set up readline options
@@ -105,6 +214,8 @@ class DroneController:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(10.0)
             self.socket.connect((self.host, self.port))
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._sel.register(self.socket, selectors.EVENT_READ)
             self.connected = True
 
             # Start receiving thread
@@ -125,168 +236,204 @@ class DroneController:
         """Disconnect from server"""
         if self.connected and self.socket:
             try:
-                self.socket.send(b"quit\n")
-                self.socket.close()
+                self.socket.sendall(b"quit\n")
             except:
                 pass
             self.connected = False
+            # Closing the socket also drops it from the selector
+            self.socket.close()
+            self._sel.close()
             print(f"{Colors.YELLOW}ℹ{Colors.END} Disconnected from server")
 
     def receive_messages(self):
         """Receive messages from server in background thread"""
-        buffer = ""
+        buffer = bytearray()
         while self.connected and self.running:
             try:
-                data = self.socket.recv(1024).decode('utf-8')
-                if not data:
-                    break
-
-                buffer += data
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    if line.strip():
-                        self.handle_server_message(line.strip())
-
-            except socket.timeout:
-                # Timeout is normal, just continue
-                continue
+                # Sleep until the socket is readable; the timeout only bounds
+                # how long it takes to notice a disconnect
+                for key, _ in self._sel.select(timeout=1.0):
+                    # Read straight into the preallocated receive buffer
+                    n = key.fileobj.recv_into(self._recv_view)
+                    if not n:
+                        return
+
+                    # Frame on raw bytes and hand each complete line to the
+                    # JSON parser undecoded
+                    buffer.extend(self._recv_view[:n])
+                    start = 0
+                    nl = buffer.find(b'\n')
+                    # Copy each line out exactly once through a view; the view
+                    # is released before the buffer is resized below
+                    with memoryview(buffer) as view:
+                        while nl != -1:
+                            line = bytes(view[start:nl]).strip()
+                            start = nl + 1
+                            if line:
+                                self.handle_server_message(line)
+                            nl = buffer.find(b'\n', start)
+                    del buffer[:start]
+
             except Exception as e:
                 if self.connected:
                     print(f"{Colors.RED}✗{Colors.END} Receive error: {e}")
                 break
 
-    def handle_server_message(self, message):
-        """Handle incoming JSON messages from server"""
+    def handle_server_message(self, message: bytes):
+        """Parse an incoming JSON line from server and handle it"""
+        try:
+            data = json_loads(message)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Fallback for non-JSON messages
+            print(f"{Colors.WHITE}Raw Response:{Colors.END}")
+            print(f"  {message.decode('utf-8', errors='replace')}")
+            return
+
+        self.handle_server_message_dict(data, message)
+
+    def handle_server_message_dict(self, data, raw: Optional[bytes] = None):
+        """Handle an already parsed JSON message from server"""
         try:
-            data = json.loads(message)
             msg_type = data.get('type', 'unknown')
             msg_text = data.get('message', '')
             timestamp = data.get('timestamp', 0)
             msg_data = data.get('data', {})
 
-            # Always show raw JSON first (like bash command output)
-            print(f"{Colors.WHITE}JSON Response:{Colors.END}")
-            print(f"  {json.dumps(data, indent=2, ensure_ascii=False)}")
-            print()
-
-            if msg_type == 'welcome':
-                print(
-                    f"{Colors.GREEN}✓{Colors.END} {Colors.BOLD}{msg_text}{Colors.END}")
-                if 'data' in data:
-                    self.print_commands(data['data'])
-
-            elif msg_type == 'command':
-                print(
-                    f"{Colors.GREEN}✓{Colors.END} Command executed: {Colors.BOLD}{msg_text}{Colors.END}")
-                if 'command_id' in msg_data:
-                    print(
-                        f"  Command ID: {Colors.CYAN}{msg_data['command_id']}{Colors.END}")
+            # A non-string type (e.g. a list) is unhashable; treat it as unknown
+            printer = self._printers.get(msg_type) if isinstance(msg_type, str) else None
 
-            elif msg_type == 'status':
-                print(f"{Colors.YELLOW}ℹ{Colors.END} Status: {msg_text}")
+            # Show raw JSON first (like bash command output) when asked to,
+            # or when there is no formatted view of this message type
+            if self.verbose or printer is None:
+                print(f"{Colors.WHITE}JSON Response:{Colors.END}")
+                print(f"  {json_dumps_pretty(data)}")
+                print()
 
-            elif msg_type == 'debug':
-                print(
-                    f"{Colors.MAGENTA}ℹ{Colors.END} Debug info: {Colors.BOLD}{msg_text}{Colors.END}")
-                self.print_debug_data(msg_data)
+            (printer or self._print_other)(data, msg_text, msg_data)
 
-            elif msg_type == 'help':
-                print(
-                    f"{Colors.CYAN}ℹ{Colors.END} Help: {Colors.BOLD}{msg_text}{Colors.END}")
-                if 'commands' in msg_data:
-                    self.print_commands(msg_data['commands'])
+        except Exception as e:
+            print(f"{Colors.RED}✗{Colors.END} Failed to parse message: {e}")
+            if raw is not None:
+                print(f"Raw message: {raw.decode('utf-8', errors='replace')}")
+            else:
+                print(f"Raw message: {data}")
 
-            elif msg_type == 'error':
-                print(f"{Colors.RED}✗{Colors.END} Error: {msg_text}")
+    def _print_welcome(self, data, msg_text, msg_data):
+        """Print a welcome message"""
+        print(
+            f"{Colors.GREEN}✓{Colors.END} {Colors.BOLD}{msg_text}{Colors.END}")
+        if 'data' in data:
+            self.print_commands(data['data'])
 
-            elif msg_type == 'goodbye':
-                print(f"{Colors.YELLOW}ℹ{Colors.END} {msg_text}")
+    def _print_command(self, data, msg_text, msg_data):
+        """Print a command acknowledgement"""
+        print(
+            f"{Colors.GREEN}✓{Colors.END} Command executed: {Colors.BOLD}{msg_text}{Colors.END}")
+        if 'command_id' in msg_data:
+            print(
+                f"  Command ID: {Colors.CYAN}{msg_data['command_id']}{Colors.END}")
 
-            else:
-                print(f"{Colors.WHITE}ℹ{Colors.END} {msg_text}")
+    def _print_status(self, data, msg_text, msg_data):
+        """Print a status message"""
+        print(f"{Colors.YELLOW}ℹ{Colors.END} Status: {msg_text}")
 
-        except json.JSONDecodeError:
-            # Fallback for non-JSON messages
-            print(f"{Colors.WHITE}Raw Response:{Colors.END}")
-            print(f"  {message}")
-        except Exception as e:
-            print(f"{Colors.RED}✗{Colors.END} Failed to parse message: {e}")
-            print(f"Raw message: {message}")
+    def _print_debug(self, data, msg_text, msg_data):
+        """Print a debug info message"""
+        print(
+            f"{Colors.MAGENTA}ℹ{Colors.END} Debug info: {Colors.BOLD}{msg_text}{Colors.END}")
+        self.print_debug_data(msg_data)
+
+    def _print_help(self, data, msg_text, msg_data):
+        """Print a help message"""
+        print(
+            f"{Colors.CYAN}ℹ{Colors.END} Help: {Colors.BOLD}{msg_text}{Colors.END}")
+        if 'commands' in msg_data:
+            self.print_commands(msg_data['commands'])
+
+    def _print_error(self, data, msg_text, msg_data):
+        """Print an error message"""
+        print(f"{Colors.RED}✗{Colors.END} Error: {msg_text}")
+
+    def _print_goodbye(self, data, msg_text, msg_data):
+        """Print a goodbye message"""
+        print(f"{Colors.YELLOW}ℹ{Colors.END} {msg_text}")
+
+    def _print_other(self, data, msg_text, msg_data):
+        """Print a message of unknown type"""
+        print(f"{Colors.WHITE}ℹ{Colors.END} {msg_text}")
 
     def print_commands(self, commands_data):
         """Print available commands in a nice format"""
-        print(f"\n{Colors.BOLD}Available Commands:{Colors.END}")
-        print("=" * 50)
-        for cmd, desc in commands_data.items():
+        sys.stdout.write(self._format_commands(tuple(commands_data)))
+        sys.stdout.flush()
+
+    def _render_commands(self, cmds: Tuple[str, ...]) -> str:
+        """Render the server-advertised command list"""
+        lines = [f"\n{Colors.BOLD}Available Commands:{Colors.END}", "=" * 50]
+        for cmd in cmds:
             if cmd in self.commands:
-                cmd_info = self.commands[cmd]
-                print(
-                    f"  {Colors.CYAN}{cmd:<3}{Colors.END} - {Colors.GREEN}{cmd_info['name']}{Colors.END}")
-                print(
-                    f"      {Colors.WHITE}{cmd_info['description']}{Colors.END}")
-        print("=" * 50)
+                name, description = self.commands[cmd]
+                lines.append(
+                    f"  {Colors.CYAN}{cmd:<3}{Colors.END} - {Colors.GREEN}{name}{Colors.END}")
+                lines.append(
+                    f"      {Colors.WHITE}{description}{Colors.END}")
+        lines.append("=" * 50)
+        return "\n".join(lines) + "\n"
 
     def print_debug_data(self, data):
         """Print debug data in a formatted way"""
+        sys.stdout.write("".join(self._format_debug_data(data)))
+        sys.stdout.flush()
+
+    def _format_debug_data(self, data) -> List[str]:
+        """Format debug data into newline-terminated output blocks"""
+        blocks = []
         if 'world_position' in data:
             pos = data['world_position']
-            print(f"  {Colors.BOLD}World Position:{Colors.END}")
-            print(f"    X: {Colors.CYAN}{pos.get('x', 'N/A'):.3f}{Colors.END}")
-            print(f"    Y: {Colors.CYAN}{pos.get('y', 'N/A'):.3f}{Colors.END}")
-            print(f"    Z: {Colors.CYAN}{pos.get('z', 'N/A'):.3f}{Colors.END}")
+            blocks.append(_POS_FMT.format(
+                _fmt_num(pos.get('x', 'N/A')),
+                _fmt_num(pos.get('y', 'N/A')),
+                _fmt_num(pos.get('z', 'N/A'))))
 
         if 'orientation' in data:
             orient = data['orientation']
-            print(f"  {Colors.BOLD}Orientation:{Colors.END}")
-            print(
-                f"    Roll:  {Colors.CYAN}{orient.get('roll', 'N/A'):.3f}{Colors.END} rad")
-            print(
-                f"    Pitch: {Colors.CYAN}{orient.get('pitch', 'N/A'):.3f}{Colors.END} rad")
-            print(
-                f"    Yaw:   {Colors.CYAN}{orient.get('yaw', 'N/A'):.3f}{Colors.END} rad")
+            blocks.append(_ORIENT_FMT.format(
+                _fmt_num(orient.get('roll', 'N/A')),
+                _fmt_num(orient.get('pitch', 'N/A')),
+                _fmt_num(orient.get('yaw', 'N/A'))))
 
         if 'velocity' in data:
             vel = data['velocity']
             if 'linear' in vel:
                 lin_vel = vel['linear']
-                print(f"  {Colors.BOLD}Linear Velocity:{Colors.END}")
-                print(
-                    f"    X: {Colors.CYAN}{lin_vel.get('x', 'N/A'):.3f}{Colors.END} m/s")
-                print(
-                    f"    Y: {Colors.CYAN}{lin_vel.get('y', 'N/A'):.3f}{Colors.END} m/s")
-                print(
-                    f"    Z: {Colors.CYAN}{lin_vel.get('z', 'N/A'):.3f}{Colors.END} m/s")
+                blocks.append(_LIN_VEL_FMT.format(
+                    _fmt_num(lin_vel.get('x', 'N/A')),
+                    _fmt_num(lin_vel.get('y', 'N/A')),
+                    _fmt_num(lin_vel.get('z', 'N/A'))))
 
         if 'imu' in data:
             imu = data['imu']
             if 'linear_acceleration' in imu:
                 acc = imu['linear_acceleration']
-                print(f"  {Colors.BOLD}IMU Acceleration:{Colors.END}")
-                print(
-                    f"    X: {Colors.CYAN}{acc.get('x', 'N/A'):.3f}{Colors.END} m/s²")
-                print(
-                    f"    Y: {Colors.CYAN}{acc.get('y', 'N/A'):.3f}{Colors.END} m/s²")
-                print(
-                    f"    Z: {Colors.CYAN}{acc.get('z', 'N/A'):.3f}{Colors.END} m/s²")
+                blocks.append(_ACC_FMT.format(
+                    _fmt_num(acc.get('x', 'N/A')),
+                    _fmt_num(acc.get('y', 'N/A')),
+                    _fmt_num(acc.get('z', 'N/A'))))
 
         if 'gnss' in data:
             gnss = data['gnss']
-            print(f"  {Colors.BOLD}GNSS:{Colors.END}")
-            print(
-                f"    Latitude:  {Colors.CYAN}{gnss.get('latitude', 'N/A'):.6f}{Colors.END}")
-            print(
-                f"    Longitude: {Colors.CYAN}{gnss.get('longitude', 'N/A'):.6f}{Colors.END}")
-            print(
-                f"    Altitude:  {Colors.CYAN}{gnss.get('altitude', 'N/A'):.3f}{Colors.END} m")
+            blocks.append(_GNSS_FMT.format(
+                _fmt_num(gnss.get('latitude', 'N/A'), '.6f'),
+                _fmt_num(gnss.get('longitude', 'N/A'), '.6f'),
+                _fmt_num(gnss.get('altitude', 'N/A'))))
 
         if 'topics' in data:
             topics = data['topics']
-            print(f"  {Colors.BOLD}ROS Topics ({len(topics)} total):{Colors.END}")
-            for topic in topics:  # Show all topics
-                name = topic.get('name', 'Unknown')
-                msg_type = topic.get('type', 'Unknown')
-                print(
-                    f"    {Colors.CYAN}{name:<30}{Colors.END} {Colors.WHITE}{msg_type}{Colors.END}")
+            blocks.append(_TOPICS_HEADER_FMT.format(len(topics)) + "".join(
+                _TOPIC_FMT.format(topic.get('name', 'Unknown'), topic.get('type', 'Unknown'))
+                for topic in topics))  # Show all topics
+
+        return blocks
 
     def send_command(self, command):
         """Send command to server"""
@@ -294,61 +441,54 @@ class DroneController:
             print(f"{Colors.RED}✗{Colors.END} Not connected to server")
             return False
 
-        try:
-            # Show what we're sending (like bash echo)
-            print(
-                f"{Colors.CYAN}$ {Colors.END}Sending command: {Colors.BOLD}'{command}'{Colors.END}")
-
-            self.socket.send((command + '\n').encode('utf-8'))
+        # Show what we're sending (like bash echo)
+        print(
+            f"{Colors.CYAN}$ {Colors.END}Sending command: {Colors.BOLD}'{command}'{Colors.END}")
 
-            # Wait a bit for response
-            time.sleep(0.1)
-            return True
+        try:
+            self.socket.sendall((command + '\n').encode('utf-8'))
         except Exception as e:
             print(f"{Colors.RED}✗{Colors.END} Failed to send command: {e}")
             return False
 
+        # The reply is printed by the receiving thread when it arrives
+        return True
+
     def show_help(self):
         """Show available commands"""
-        print(f"\n{Colors.BOLD}Available Commands:{Colors.END}")
-        print("─" * 60)
-
-        # Group commands by category
-        flight_commands = ['a', 'd', 't', 'l']
-        mission_commands = ['r', 's', '1', '2', '3', '4']
-        info_commands = ['p', 'i']
-        system_commands = ['h', 'q']
-
-        print(f"{Colors.BOLD}Flight Control:{Colors.END}")
-        for cmd in flight_commands:
-            if cmd in self.commands:
-                info = self.commands[cmd]
-                print(
-                    f"  {Colors.CYAN}{cmd}{Colors.END}  {Colors.GREEN}{info['name']:<12}{Colors.END} {Colors.WHITE}{info['description']}{Colors.END}")
-
-        print(f"\n{Colors.BOLD}Mission Control:{Colors.END}")
-        for cmd in mission_commands:
-            if cmd in self.commands:
-                info = self.commands[cmd]
-                print(
-                    f"  {Colors.CYAN}{cmd}{Colors.END}  {Colors.GREEN}{info['name']:<12}{Colors.END} {Colors.WHITE}{info['description']}{Colors.END}")
-
-        print(f"\n{Colors.BOLD}Information:{Colors.END}")
-        for cmd in info_commands:
-            if cmd in self.commands:
-                info = self.commands[cmd]
-                print(
-                    f"  {Colors.CYAN}{cmd}{Colors.END}  {Colors.GREEN}{info['name']:<12}{Colors.END} {Colors.WHITE}{info['description']}{Colors.END}")
-
-        print(f"\n{Colors.BOLD}System:{Colors.END}")
-        for cmd in system_commands:
-            if cmd in self.commands:
-                info = self.commands[cmd]
-                print(
-                    f"  {Colors.CYAN}{cmd}{Colors.END}  {Colors.GREEN}{info['name']:<12}{Colors.END} {Colors.WHITE}{info['description']}{Colors.END}")
-
-        print("─" * 60)
-        print(f"Also try: {Colors.CYAN}clear{Colors.END}, {Colors.CYAN}ls{Colors.END}, {Colors.CYAN}help{Colors.END}, {Colors.CYAN}quit{Colors.END}")
+        sys.stdout.write(self._help_text)
+        sys.stdout.flush()
+
+    def _render_help(self) -> str:
+        """Render the grouped help screen"""
+        lines = [f"\n{Colors.BOLD}Available Commands:{Colors.END}", "─" * 60]
+        groups = (
+            ("Flight Control", self._flight),
+            ("Mission Control", self._mission),
+            ("Information", self._info),
+            ("System", self._system),
+        )
+        for i, (title, group) in enumerate(groups):
+            if i:
+                lines.append("")
+            lines.append(f"{Colors.BOLD}{title}:{Colors.END}")
+            for cmd, name, description in group:
+                lines.append(
+                    f"  {Colors.CYAN}{cmd}{Colors.END}  {Colors.GREEN}{name:<12}{Colors.END} {Colors.WHITE}{description}{Colors.END}")
+
+        lines.append("─" * 60)
+        lines.append(
+            f"Also try: {Colors.CYAN}clear{Colors.END}, {Colors.CYAN}ls{Colors.END}, {Colors.CYAN}help{Colors.END}, {Colors.CYAN}quit{Colors.END}")
+        return "\n".join(lines) + "\n"
+
+    def _quit(self):
+        """Leave interactive mode"""
+        print(f"{Colors.YELLOW}Exiting...{Colors.END}")
+        self.running = False
+
+    def _clear(self):
+        """Clear the terminal"""
+        os.system('clear' if os.name == 'posix' else 'cls')
 
     def interactive_mode(self):
         """Run interactive command mode"""
@@ -361,9 +501,7 @@ class DroneController:
 
         while self.connected and self.running:
             try:
-                # Bash-like prompt with current time
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+                # Bash-like prompt
                 prompt = f"{Colors.BOLD}{Colors.GREEN}> {Colors.END}"
                 command = input(prompt).strip()
 
@@ -371,24 +509,16 @@ class DroneController:
                     continue
 
                 # Handle special commands first
-                if command == 'q' or command == 'quit' or command == 'exit':
-                    print(f"{Colors.YELLOW}Exiting...{Colors.END}")
-                    break
-                elif command == 'h' or command == 'help':
-                    self.show_help()
-                    continue
-                elif command == 'clear':
-                    os.system('clear' if os.name == 'posix' else 'cls')
-                    continue
-                elif command == 'ls' or command == 'commands':
-                    self.show_help()
+                handler = self._dispatch.get(command)
+                if handler:
+                    handler()
                     continue
 
                 # Process single character commands
                 if len(command) == 1 and command in self.commands:
-                    cmd_info = self.commands[command]
+                    name, description = self.commands[command]
                     print(
-                        f"{Colors.CYAN}> {Colors.END}Executing: {Colors.BOLD}{cmd_info['name']}{Colors.END} - {cmd_info['description']}")
+                        f"{Colors.CYAN}> {Colors.END}Executing: {Colors.BOLD}{name}{Colors.END} - {description}")
 
                     if self.send_command(command):
                         # The response will be handled by handle_server_message
@@ -429,10 +559,12 @@ def main():
                         help='Server host (default: localhost)')
     parser.add_argument('--port', type=int, default=8888,
                         help='Server port (default: 8888)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Echo the raw JSON of every server message')
 
     args = parser.parse_args()
 
-    controller = DroneController(args.host, args.port)
+    controller = DroneController(args.host, args.port, args.verbose)
     controller.run()
 
 